@@ -1,15 +1,17 @@
 from fastapi import FastAPI, Query
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from typing import Optional
+from cachetools import TTLCache
 from .models import SignalResponse
-from .services.exchanges import fetch_ohlcv_cached, fetch_funding_rate
-from .services.indicators import rsi, macd
-from .services.signals import calculate_signal
+from .services.exchanges import (
+    fetch_ohlcv_async, fetch_funding_rate_cached_async, fetch_funding_rates_batch, refresh_hot_funding,
+    normalize_symbol, close_async_exchanges, close_async_http,
+)
+from .services.indicators import rsi, macd, bfill
+from .services.signals import calculate_signal_async
 import logging, asyncio, os
-
-from .services.exchanges import fetch_ohlcv_cached, fetch_funding_rate_cached
+from concurrent.futures import ThreadPoolExecutor
 
 # configure logging early (before app startup)
 logging.basicConfig(
@@ -17,67 +19,116 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(name)s - %(message)s"
 )
 
-app = FastAPI(title="Crypto Signal API", version="0.1.0")
+app = FastAPI(title="Crypto Signal API", version="0.1.0", default_response_class=ORJSONResponse)
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True,
                    allow_methods=["*"], allow_headers=["*"])
 
+# Per-worker size of the event loop's default executor, which runs the blocking calls
+# (Redis tier, serialization) offloaded with asyncio.to_thread. Each uvicorn worker
+# process gets its own pool of this size.
+THREAD_POOL_SIZE = int(os.getenv("THREAD_POOL_SIZE", "64"))
+
+# Serialized indicator outputs keyed on the OHLCV frame they were computed from
+_IND_CACHE = TTLCache(maxsize=1024, ttl=300)
+
+# Symbols/timeframes offered by the dashboard, warmed at startup
+WARM_SYMBOLS = ("BTC/USDT", "ETH/USDT", "SOL/USDT")
+WARM_TIMEFRAMES = ("1h", "4h", "1d")
+# Seconds between background scans for hot funding entries to renew; 0 disables the refresher
+FUNDING_REFRESH_INTERVAL = float(os.getenv("FUNDING_REFRESH_INTERVAL", "30"))
+_refresh_task: Optional[asyncio.Task] = None
+
+@app.on_event("startup")
+async def configure_executor():
+    # Registered before warm_caches so the warm-up already uses the larger pool
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE))
+
 @app.on_event("startup")
 async def warm_caches():
-    loop = asyncio.get_event_loop()
-    pairs = [("BTC/USDT", "1h"), ("ETH/USDT", "4h")]
+    pairs = [(sym, tf) for sym in WARM_SYMBOLS for tf in WARM_TIMEFRAMES]
     try:
-        tasks = [loop.run_in_executor(None, fetch_ohlcv_cached, sym, tf, 300, "binance") for sym, tf in pairs]
+        # Fetches overlap on the event loop; the shared async exchange's rate limiter paces them
+        tasks = [fetch_ohlcv_async(sym, tf, 300, "binance") for sym, tf in pairs]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         for (sym, tf), res in zip(pairs, results):
             if isinstance(res, Exception):
                 logging.warning("Cache warm failed for %s %s: %s", sym, tf, res)
             else:
-                rows = getattr(res, "shape", (0, 0))[0]
+                rows = len(res)
                 logging.info("Cache warm completed for %s %s, rows=%d", sym, tf, rows)
+
+        funding = await fetch_funding_rates_batch([normalize_symbol(sym) for sym in WARM_SYMBOLS])
+        logging.info("Funding warm completed for %d/%d symbols",
+                     sum(v is not None for v in funding.values()), len(funding))
     except Exception as e:
         logging.exception("Warm caches failed: %s", e)
 
+@app.on_event("startup")
+async def start_funding_refresher():
+    global _refresh_task
+    if FUNDING_REFRESH_INTERVAL > 0:
+        _refresh_task = asyncio.create_task(refresh_hot_funding(interval=FUNDING_REFRESH_INTERVAL))
+
+@app.on_event("shutdown")
+async def close_clients():
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+    await close_async_exchanges()
+    await close_async_http()
+
 @app.get("/", include_in_schema=False)
 def index():
     return RedirectResponse(url="/docs")
 
 @app.get("/api/ohlcv")
-def get_ohlcv(symbol: str, timeframe: str = "1h", limit: int = 300, exchange: str = "binance"):
+async def get_ohlcv(symbol: str, timeframe: str = "1h", limit: int = 300, exchange: str = "binance"):
     try:
-        df = fetch_ohlcv_cached(symbol, timeframe=timeframe, limit=limit, exchange=exchange)
-        return {"symbol": symbol, "timeframe": timeframe, "exchange": exchange, "data": df.to_dict(orient="records")}
+        ohlcv = await fetch_ohlcv_async(symbol, timeframe=timeframe, limit=limit, exchange=exchange)
+        # Columnar payload of numpy arrays, serialized by orjson without per-row dicts
+        return ORJSONResponse({"symbol": symbol, "timeframe": timeframe, "exchange": exchange,
+                               "data": ohlcv.to_dict()})
     except Exception as e:
         return {"error": f"Failed to fetch OHLCV data: {str(e)}", "symbol": symbol, "exchange": exchange}
 
 @app.get("/api/indicators")
-def get_indicators(symbol: str, timeframe: str = "1h", limit: int = 300, exchange: str = "binance",
+async def get_indicators(symbol: str, timeframe: str = "1h", limit: int = 300, exchange: str = "binance",
                    indicators: Optional[str] = Query(None, description="Comma-separated: RSI,MACD")):
     try:
-        df = fetch_ohlcv_cached(symbol, timeframe=timeframe, limit=limit, exchange=exchange)
+        ohlcv = await fetch_ohlcv_async(symbol, timeframe=timeframe, limit=limit, exchange=exchange)
         out = {"symbol": symbol, "timeframe": timeframe, "exchange": exchange}
         inds = [x.strip().upper() for x in indicators.split(",")] if indicators else ["RSI","MACD"]
 
+        close = ohlcv.close
+        version = (symbol, timeframe, exchange) + ohlcv.version()
+
         if "RSI" in inds:
-            rsi_data = rsi(df["close"]).fillna(method="bfill")
-            out["RSI"] = rsi_data.tolist()
+            key = ("RSI",) + version
+            rsi_data = _IND_CACHE.get(key)
+            if rsi_data is None:
+                rsi_data = _IND_CACHE[key] = bfill(rsi(close)).tolist()
+            out["RSI"] = rsi_data
 
         if "MACD" in inds:
-            dif, dea, hist = macd(df["close"])
-            out["MACD"] = {
-                "dif": dif.fillna(method="bfill").tolist(),
-                "dea": dea.fillna(method="bfill").tolist(),
-                "hist": hist.fillna(method="bfill").tolist()
-            }
+            key = ("MACD",) + version
+            macd_data = _IND_CACHE.get(key)
+            if macd_data is None:
+                dif, dea, hist = macd(close)
+                macd_data = _IND_CACHE[key] = {
+                    "dif": bfill(dif).tolist(),
+                    "dea": bfill(dea).tolist(),
+                    "hist": bfill(hist).tolist()
+                }
+            out["MACD"] = macd_data
         return out
     except Exception as e:
         return {"error": f"Failed to calculate indicators: {str(e)}", "symbol": symbol, "exchange": exchange}
 
 @app.get("/api/funding")
-def get_funding(symbol: str, exchange: str = "binance"):
+async def get_funding(symbol: str, exchange: str = "binance"):
     """Get funding rate data with caching for better performance."""
     try:
-        sym = symbol.replace("/", "")
-        data = fetch_funding_rate_cached(sym, exchange=exchange, cache_seconds=300)
+        sym = normalize_symbol(symbol)
+        data = await fetch_funding_rate_cached_async(sym, exchange=exchange, cache_seconds=300)
         if data is None:
             return {"error": f"Funding rate not available for {symbol} on {exchange}",
                    "symbol": symbol, "exchange": exchange}
@@ -86,31 +137,34 @@ def get_funding(symbol: str, exchange: str = "binance"):
         return {"error": f"Failed to fetch funding rate: {str(e)}",
                "symbol": symbol, "exchange": exchange}
 
-@app.get("/api/signals", response_model=SignalResponse)
-def get_signals(symbol: str, timeframe: str = "1h", limit: int = 300, exchange: str = "binance"):
+# SignalResponse documents the schema; the handler builds the dict itself and skips
+# response_model validation since every field comes from calculate_signal
+@app.get("/api/signals", response_model=None, responses={200: {"model": SignalResponse}})
+async def get_signals(symbol: str, timeframe: str = "1h", limit: int = 300, exchange: str = "binance"):
     try:
-        df = fetch_ohlcv_cached(symbol, timeframe=timeframe, limit=limit, exchange=exchange)
-        signal_data = calculate_signal(df, symbol, exchange=exchange)
-
-        return SignalResponse(
-            symbol=symbol,
-            timeframe=timeframe,
-            action=signal_data["action"],
-            scores=signal_data["scores"],
-            reasons=signal_data["reasons"],
-            levels=signal_data["levels"],
-            meta={"limit": limit, "exchange": exchange}
-        )
+        ohlcv = await fetch_ohlcv_async(symbol, timeframe=timeframe, limit=limit, exchange=exchange)
+        signal_data = await calculate_signal_async(ohlcv, symbol, exchange=exchange, timeframe=timeframe)
+
+        return ORJSONResponse({
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "action": signal_data["action"],
+            "scores": signal_data["scores"],
+            "reasons": signal_data["reasons"],
+            "levels": signal_data["levels"],
+            "meta": {"limit": limit, "exchange": exchange}
+        })
     except Exception as e:
         # Return a proper error response that matches SignalResponse structure
-        return SignalResponse(
-            symbol=symbol, timeframe=timeframe, action="wait",
-            scores={"rsi": 0.0, "funding": 0.0, "macd_hist": 0.0, "dif": 0.0, "dea": 0.0},
-            reasons=[f"Signal calculation failed: {str(e)}"],
-            levels={"support": 0.0, "resistance": 0.0},
-            meta={"limit": limit, "exchange": exchange, "error": str(e)}
-        )
+        return ORJSONResponse({
+            "symbol": symbol, "timeframe": timeframe, "action": "wait",
+            "scores": {"rsi": 0.0, "funding": 0.0, "macd_hist": 0.0, "dif": 0.0, "dea": 0.0},
+            "reasons": [f"Signal calculation failed: {str(e)}"],
+            "levels": {"support": 0.0, "resistance": 0.0},
+            "meta": {"limit": limit, "exchange": exchange, "error": str(e)}
+        })
 
 if os.getenv("SERVE_REACT", "0") == "1":
+    from fastapi.staticfiles import StaticFiles
     # mount last so /api routes keep working
     app.mount("/", StaticFiles(directory="crypto-signal-frontend/dist", html=True), name="frontend")
@@ -1,5 +1,5 @@
 from typing import List, Optional, Literal, Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class OHLCVQuery(BaseModel):
     symbol: str
@@ -11,6 +11,8 @@ class IndicatorQuery(OHLCVQuery):
     indicators: Optional[List[Literal["RSI","MACD"]]] = None
 
 class SignalResponse(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True, arbitrary_types_allowed=False)
+
     symbol: str
     timeframe: str
     action: Literal["buy","sell","wait"]
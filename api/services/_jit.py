@@ -0,0 +1,14 @@
+"""
+Optional Numba support: ``njit`` compiles when numba is installed and falls back to plain Python otherwise
+"""
+try:
+    from numba import njit
+except ImportError:  # numba is an optional speed-up
+    def njit(*args, **kwargs):
+        # Support both @njit and @njit(...) forms
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
@@ -0,0 +1,96 @@
+"""
+Cross-worker cache tier backed by Redis, enabled by setting REDIS_URL
+
+Each entry is a hash of {generated_at, stale_at, body}. Keys outlive their freshness window by
+STALE_GRACE seconds so callers can fall back to the last good copy when an upstream fetch fails.
+"""
+import os
+import time
+import logging
+from dataclasses import dataclass
+from typing import Dict, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL")
+STALE_GRACE = int(os.getenv("CACHE_STALE_GRACE", "3600"))
+
+if REDIS_URL:
+    # Imported only when configured so local-cache-only workers don't pay for the client
+    import redis
+    _redis = redis.Redis.from_url(REDIS_URL, socket_timeout=0.5)
+    _RedisError = redis.RedisError
+else:
+    _redis = None
+    _RedisError = Exception
+
+@dataclass(frozen=True)
+class Entry:
+    body: bytes
+    generated_at: float
+    stale_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.stale_at
+
+def enabled() -> bool:
+    """Whether the Redis tier is configured; callers can skip encoding bodies that put would drop."""
+    return _redis is not None
+
+def get(key: str) -> Optional[Entry]:
+    """
+    Load the entry stored under key, fresh or stale.
+
+    Returns:
+        The Entry, or None on a miss, when Redis is disabled or unreachable
+    """
+    if _redis is None:
+        return None
+    try:
+        fields = _redis.hgetall(key)
+    except _RedisError as e:
+        logger.warning("Redis get failed for %s: %s", key, str(e))
+        return None
+    if not fields or b"body" not in fields:
+        return None
+    return Entry(
+        body=fields[b"body"],
+        generated_at=float(fields.get(b"generated_at", 0.0)),
+        stale_at=float(fields.get(b"stale_at", 0.0)),
+    )
+
+def put(key: str, body: bytes, ttl: float) -> None:
+    """Store body under key, fresh for ttl seconds and kept STALE_GRACE seconds longer (no-op when Redis is disabled)."""
+    if _redis is None:
+        return
+    now = time.time()
+    try:
+        pipe = _redis.pipeline()
+        pipe.hset(key, mapping={"generated_at": now, "stale_at": now + ttl, "body": body})
+        pipe.expire(key, max(1, int(ttl + STALE_GRACE)))
+        pipe.execute()
+    except _RedisError as e:
+        logger.warning("Redis set failed for %s: %s", key, str(e))
+
+def columns_to_bytes(columns: Dict[str, np.ndarray]) -> bytes:
+    """Encode equal-length numeric columns as an Arrow IPC stream."""
+    # Arrow is only needed for Redis bodies; workers without REDIS_URL never import it
+    import pyarrow as pa
+    table = pa.table(columns)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+def columns_from_bytes(body: bytes) -> Dict[str, np.ndarray]:
+    """
+    Decode an Arrow IPC stream written by columns_to_bytes.
+
+    Arrow hands out read-only views of the buffer; each column is copied once so callers get
+    ordinary writable arrays (numba kernels compiled for float64[:] reject read-only input).
+    """
+    import pyarrow as pa
+    table = pa.ipc.open_stream(body).read_all().combine_chunks()
+    return {name: np.array(col.to_numpy()) for name, col in zip(table.column_names, table.columns)}
@@ -1,12 +1,185 @@
+import sys
 import time
-from typing import Dict, Any, Optional
-import pandas as pd
-import ccxt, requests
+import atexit
+import functools
+import asyncio
+import threading
+import weakref
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, ClassVar, Tuple
+from dataclasses import dataclass
+import numpy as np
+import ccxt, requests, httpx
+import ccxt.async_support as ccxt_a
+import os
 import logging
-from cachetools import TTLCache, cached
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import TLRUCache
+from . import cache
+from .ratelimit import TokenBucket, BucketTimeRate
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
-_funding_cache = {}
+# (symbol, exchange) -> (data, fetched_at, stale_at)
+_funding_cache: Dict[Tuple[str, str], Tuple[Dict, float, float]] = {}
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Freshness bounds for one cached endpoint.
+
+    A fetched value stays fresh for the caller's cache_seconds plus the time the fetch took (a slow
+    upstream earns a longer lifetime), clamped to [min_ttl, max_ttl]. Past hard_ttl it is no longer
+    served even as a fallback when the upstream fails.
+    """
+    min_ttl: float
+    max_ttl: float
+    hard_ttl: float
+
+    def lifetime(self, cache_seconds: float, fetch_elapsed: float) -> float:
+        return min(self.max_ttl, max(self.min_ttl, fetch_elapsed + cache_seconds))
+
+# Keyed by endpoint, or "endpoint:SYMBOL" to override one symbol
+cache_policy: Dict[str, CachePolicy] = {
+    "funding": CachePolicy(min_ttl=60, max_ttl=900, hard_ttl=3000),
+}
+
+def _policy_for(endpoint: str, symbol: str) -> CachePolicy:
+    return cache_policy.get(f"{endpoint}:{symbol}") or cache_policy[endpoint]
+
+BINANCE_PREMIUM_INDEX_URL = "https://fapi.binance.com/fapi/v1/premiumIndex"
+
+# Binance budget in requests per minute for the whole deployment, split evenly across uvicorn workers
+BINANCE_RPM = int(os.getenv("BINANCE_RPM", "1200"))
+WEB_CONCURRENCY = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+_binance_limiter = TokenBucket(BINANCE_RPM / WEB_CONCURRENCY)
+# premiumIndex without a symbol costs 10 request weight instead of 1
+PREMIUM_INDEX_ALL_COST = 10
+
+# Shared HTTP session so sync funding lookups keep connections to fapi.binance.com warm
+# Transient 429/5xx answers are retried with a short backoff (honouring Retry-After) before falling back to cache
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(
+    pool_connections=20, pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504)),
+))
+atexit.register(_http.close)
+
+# Shared async HTTP/2 client for the async endpoints; created on first use inside the event loop
+_async_http: Optional[httpx.AsyncClient] = None
+
+def _get_async_http() -> httpx.AsyncClient:
+    global _async_http
+    if _async_http is None or _async_http.is_closed:
+        _async_http = httpx.AsyncClient(
+            http2=True, timeout=10, limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _async_http
+
+async def close_async_http() -> None:
+    """Close the shared async HTTP client (call from the app shutdown hook)."""
+    global _async_http
+    if _async_http is not None:
+        await _async_http.aclose()
+        _async_http = None
+
+# Per-key locks so concurrent async misses for one symbol share a single upstream call; weakly held
+# like _sync_locks below, so keys nobody is fetching (e.g. invalid symbols) don't accumulate locks
+_funding_locks: "weakref.WeakValueDictionary[Tuple[str, str], asyncio.Lock]" = weakref.WeakValueDictionary()
+
+def _funding_lock(cache_key: Tuple[str, str]) -> asyncio.Lock:
+    """Return the async lock for cache_key, creating it if needed; callers must keep a reference while using it."""
+    lock = _funding_locks.get(cache_key)
+    if lock is None:
+        lock = _funding_locks[cache_key] = asyncio.Lock()
+    return lock
+
+# Lookups per funding key over the last few minutes; refresh_hot_funding only renews keys in use
+_funding_hits = BucketTimeRate(minutes=5)
+# Base lifetime for background refreshes, the same the endpoints request
+FUNDING_REFRESH_CACHE_SECONDS = 300
+
+# Sync counterpart for executor threads; entries vanish once no thread holds or waits on them
+_sync_locks: "weakref.WeakValueDictionary[tuple, threading.Lock]" = weakref.WeakValueDictionary()
+_sync_locks_guard = threading.Lock()
+
+def _sync_key_lock(key: tuple) -> threading.Lock:
+    """Return the lock for key, creating it if needed; callers must keep a reference while using it."""
+    with _sync_locks_guard:
+        lock = _sync_locks.get(key)
+        if lock is None:
+            lock = _sync_locks[key] = threading.Lock()
+        return lock
+
+def _past_next_funding(data: Dict, current_time: float) -> bool:
+    next_funding_ms = data.get("nextFundingTime", 0)
+    return bool(next_funding_ms) and current_time * 1000 >= next_funding_ms
+
+def _get_fresh_funding(cache_key: Tuple[str, str], current_time: float) -> Optional[Dict]:
+    """
+    Return the cached funding entry for cache_key if it has not reached its stale_at.
+
+    An entry also goes stale once its nextFundingTime has passed, since the rate rolls over then.
+    """
+    if cache_key in _funding_cache:
+        cached_data, _, stale_at = _funding_cache[cache_key]
+        if _past_next_funding(cached_data, current_time):
+            return None
+        if current_time < stale_at:
+            return cached_data
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def normalize_symbol(symbol: str) -> str:
+    """
+    Canonical funding symbol ('btc/usdt' -> 'BTCUSDT').
+
+    Interned once here at the ingress boundary and memoized, so repeats return the same string object
+    and the funding cache keys built from it hash and compare by identity.
+    """
+    return sys.intern(symbol.replace("/", "").upper())
+
+def _funding_key(symbol: str, exchange: str) -> Tuple[str, str]:
+    """In-process cache key; symbol is expected to come from normalize_symbol."""
+    return symbol, exchange
+
+def _funding_redis_key(cache_key: Tuple[str, str]) -> str:
+    symbol, exchange = cache_key
+    return f"funding:{exchange}:{symbol}"
+
+def _lookup_funding(cache_key: Tuple[str, str], policy: CachePolicy,
+                    current_time: float) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """
+    Look a funding rate up in the local then the Redis tier.
+
+    Returns:
+        (fresh, stale): fresh data if either tier has it, otherwise the newest copy younger than
+        the policy's hard_ttl for fallback (None if there is none)
+    """
+    fresh = _get_fresh_funding(cache_key, current_time)
+    if fresh is not None:
+        return fresh, None
+
+    entry = cache.get(_funding_redis_key(cache_key))
+    shared = orjson.loads(entry.body) if entry is not None else None
+    if shared is not None and entry.fresh and not _past_next_funding(shared, current_time):
+        _funding_cache[cache_key] = (shared, entry.generated_at, entry.stale_at)
+        return shared, None
+
+    if cache_key in _funding_cache:
+        local, fetched_at, _ = _funding_cache[cache_key]
+        if current_time - fetched_at < policy.hard_ttl:
+            return None, local
+    if shared is not None and current_time - entry.generated_at < policy.hard_ttl:
+        return None, shared
+    return None, None
+
+def _store_funding(cache_key: Tuple[str, str], data: Dict, fetched_at: float, ttl: float) -> None:
+    _funding_cache[cache_key] = (data, fetched_at, fetched_at + ttl)
+    cache.put(_funding_redis_key(cache_key), orjson.dumps(data), ttl)
 
 def fetch_funding_rate_cached(symbol: str, exchange: str = "binance", cache_seconds: int = 300) -> Optional[Dict]:
     """
@@ -15,44 +188,351 @@ def fetch_funding_rate_cached(symbol: str, exchange: str = "binance", cache_seco
     Args:
         symbol: Trading pair symbol (e.g., 'BTCUSDT')
         exchange: Exchange name (default: 'binance')
-        cache_seconds: Cache duration in seconds (default: 300 = 5 minutes)
+        cache_seconds: Base cache duration in seconds (default: 300 = 5 minutes), adjusted by cache_policy
 
     Returns:
-        Dict containing funding rate data or None if fetch fails
+        Dict containing funding rate data, the last stale copy within the hard TTL if the fetch fails, or None
     """
-    cache_key = f"{symbol}_{exchange}"
-    current_time = time.time()
+    cache_key = _funding_key(symbol, exchange)
+    _funding_hits.hit(cache_key)
 
     # Check if we have valid cached data
-    if cache_key in _funding_cache:
-        cached_data, timestamp = _funding_cache[cache_key]
-        if current_time - timestamp < cache_seconds:
-            logger.debug("Returning cached funding rate for %s@%s", symbol, exchange)
+    cached_data = _get_fresh_funding(cache_key, time.time())
+    if cached_data is not None:
+        logger.debug("Returning cached funding rate for %s@%s", symbol, exchange)
+        return cached_data
+
+    lock = _sync_key_lock(("funding",) + cache_key)
+    with lock:
+        # Another thread may have refreshed the entry while we waited for the lock
+        current_time = time.time()
+        policy = _policy_for("funding", symbol)
+        cached_data, stale = _lookup_funding(cache_key, policy, current_time)
+        if cached_data is not None:
             return cached_data
 
-    # Fetch fresh data
-    try:
-        fresh_data = fetch_funding_rate(symbol, exchange)
+        # Fetch fresh data
+        try:
+            fresh_data = fetch_funding_rate(symbol, exchange)
+        except Exception as e:
+            logger.exception("Error fetching funding rate for %s@%s", symbol, exchange)
+            fresh_data = None
+            if stale is None:
+                raise e
         if fresh_data:
-            _funding_cache[cache_key] = (fresh_data, current_time)
-        return fresh_data
-    except Exception as e:
-        logger.exception("Error fetching funding rate for %s@%s", symbol, exchange)
-        # Return cached data if available, even if expired, as fallback
-        if cache_key in _funding_cache:
-            cached_data, _ = _funding_cache[cache_key]
+            ttl = policy.lifetime(cache_seconds, time.time() - current_time)
+            _store_funding(cache_key, fresh_data, current_time, ttl)
+            return fresh_data
+        # Return cached data if available, even if expired (up to the hard TTL), as fallback
+        if stale is not None:
             logger.warning("Returning stale cached funding rate for %s@%s due to fetch error", symbol, exchange)
+            return stale
+        return fresh_data
+
+async def fetch_funding_rate_cached_async(symbol: str, exchange: str = "binance", cache_seconds: int = 300) -> Optional[Dict]:
+    """
+    Async variant of fetch_funding_rate_cached sharing the same cache.
+
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTCUSDT')
+        exchange: Exchange name (default: 'binance')
+        cache_seconds: Base cache duration in seconds (default: 300 = 5 minutes), adjusted by cache_policy
+
+    Returns:
+        Dict containing funding rate data, the last stale copy within the hard TTL if the fetch fails, or None
+    """
+    cache_key = _funding_key(symbol, exchange)
+    _funding_hits.hit(cache_key)
+
+    cached_data = _get_fresh_funding(cache_key, time.time())
+    if cached_data is not None:
+        logger.debug("Returning cached funding rate for %s@%s", symbol, exchange)
+        return cached_data
+
+    lock = _funding_lock(cache_key)
+    async with lock:
+        # Another request may have refreshed the entry while we waited for the lock
+        current_time = time.time()
+        policy = _policy_for("funding", symbol)
+        cached_data, stale = await asyncio.to_thread(_lookup_funding, cache_key, policy, current_time)
+        if cached_data is not None:
             return cached_data
-        raise e
+
+        try:
+            fresh_data = await fetch_funding_rate_async(symbol, exchange)
+        except Exception as e:
+            logger.exception("Error fetching funding rate for %s@%s", symbol, exchange)
+            fresh_data = None
+            if stale is None:
+                raise e
+        if fresh_data:
+            ttl = policy.lifetime(cache_seconds, time.time() - current_time)
+            await asyncio.to_thread(_store_funding, cache_key, fresh_data, current_time, ttl)
+            return fresh_data
+        if stale is not None:
+            logger.warning("Returning stale cached funding rate for %s@%s due to fetch error", symbol, exchange)
+            return stale
+        return fresh_data
+
+async def _refresh_funding(cache_key: Tuple[str, str]) -> None:
+    symbol, exchange = cache_key
+    lock = _funding_lock(cache_key)
+    async with lock:
+        start = time.time()
+        data = await fetch_funding_rate_async(symbol, exchange)
+        if data:
+            ttl = _policy_for("funding", symbol).lifetime(FUNDING_REFRESH_CACHE_SECONDS, time.time() - start)
+            await asyncio.to_thread(_store_funding, cache_key, data, start, ttl)
+
+async def refresh_hot_funding(interval: float = 30, min_hits: int = 3, ahead: float = 0.8) -> None:
+    """
+    Renew frequently read funding entries before they go stale, so readers rarely wait on a miss.
+
+    Runs until cancelled (start it as a task from the app startup hook).
+
+    Args:
+        interval: Seconds between scans of the funding cache
+        min_hits: Lookups within the access window for a key to count as hot
+        ahead: Fraction of an entry's lifetime after which it is refreshed
+    """
+    while True:
+        await asyncio.sleep(interval)
+        now = time.time()
+        due = [
+            key for key, (data, fetched_at, stale_at) in list(_funding_cache.items())
+            if (now >= fetched_at + ahead * (stale_at - fetched_at) or _past_next_funding(data, now))
+            and _funding_hits.count(key) >= min_hits
+        ]
+        if not due:
+            continue
+        results = await asyncio.gather(*[_refresh_funding(key) for key in due], return_exceptions=True)
+        for (symbol, exchange), res in zip(due, results):
+            if isinstance(res, Exception):
+                logger.warning("Background funding refresh failed for %s@%s: %s", symbol, exchange, str(res))
+        logger.debug("Refreshed %d hot funding entries", len(due))
+
+async def fetch_funding_rates_batch(symbols: List[str], exchange: str = "binance",
+                                    cache_seconds: int = 300) -> Dict[str, Optional[Dict]]:
+    """
+    Fetch funding rates for several symbols over the shared async client.
+
+    With PREMIUM_INDEX_ALL_COST or more cache misses they are filled from one all-symbol premiumIndex
+    request; fewer misses, and symbols it doesn't cover, use concurrent per-symbol fetches.
+
+    Args:
+        symbols: Symbols without slash (e.g., ['BTCUSDT', 'ETHUSDT'])
+        exchange: Exchange name
+        cache_seconds: Cache duration in seconds
+
+    Returns:
+        Dict mapping each symbol to its funding rate data, or None if it could not be fetched
+    """
+    current_time = time.time()
+    out = {s: _get_fresh_funding(_funding_key(s, exchange), current_time) for s in symbols}
+    missing = [s for s, data in out.items() if data is None]
+
+    # The all-symbol request costs PREMIUM_INDEX_ALL_COST weight and downloads every contract, so it
+    # only pays off once that many symbols would otherwise be fetched one request (1 weight) each
+    if len(missing) >= PREMIUM_INDEX_ALL_COST:
+        fetched = await fetch_all_funding_rates_async(exchange)
+        elapsed = time.time() - current_time
+        requested = set(missing)
+        for sym, data in fetched.items():
+            if data is None:
+                continue
+            key = _funding_key(sym, exchange)
+            ttl = _policy_for("funding", sym).lifetime(cache_seconds, elapsed)
+            if sym in requested:
+                # Requested symbols also go to the shared tier; the rest only warm this process
+                out[sym] = data
+                await asyncio.to_thread(_store_funding, key, data, current_time, ttl)
+            else:
+                _funding_cache[key] = (data, current_time, current_time + ttl)
+        missing = [s for s in missing if out[s] is None]
+
+    # Anything the bulk call didn't cover goes through the per-symbol path (with its stale fallback)
+    results = await asyncio.gather(
+        *[fetch_funding_rate_cached_async(s, exchange=exchange, cache_seconds=cache_seconds) for s in missing],
+        return_exceptions=True,
+    )
+    for sym, res in zip(missing, results):
+        if isinstance(res, Exception):
+            logger.warning("Batch funding fetch failed for %s@%s: %s", sym, exchange, str(res))
+            res = None
+        out[sym] = res
+    return out
+
+# One sync ccxt instance per exchange name, reused so markets and keep-alive connections persist
+_EXCHANGES: Dict[str, "ccxt.Exchange"] = {}
+_exchange_lock = threading.Lock()
 
 def get_exchange(name: str = "binance"):
-    ex = getattr(ccxt, name)()
-    ex.enableRateLimit = True
+    """Return the shared ccxt exchange, loading markets on first use."""
+    ex = _EXCHANGES.get(name)
+    if ex is not None:
+        return ex
+    with _exchange_lock:
+        ex = _EXCHANGES.get(name)
+        if ex is None:
+            ex = getattr(ccxt, name)()
+            ex.enableRateLimit = True
+            # ccxt's default session pools 10 connections per host; size it for the worker threads
+            ex.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+            ex.load_markets()
+            _EXCHANGES[name] = ex
+    return ex
+
+# One async ccxt instance per exchange name, shared by every request on the event loop
+_ASYNC_EXCHANGES: Dict[str, "ccxt_a.Exchange"] = {}
+# In-flight market loads, so every concurrent first use waits on one load_markets call and shares its outcome
+_async_exchange_inflight: Dict[str, "asyncio.Task"] = {}
+# A failed load is re-raised to new callers for this long instead of hitting an unreachable exchange again
+EXCHANGE_INIT_RETRY_SECONDS = 5
+_async_exchange_failures: Dict[str, Tuple[BaseException, float]] = {}
+
+async def _init_async_exchange(name: str):
+    ex = getattr(ccxt_a, name)({"enableRateLimit": True})
+    try:
+        await ex.load_markets()
+    except Exception as e:
+        _async_exchange_failures[name] = (e, time.time())
+        await ex.close()
+        raise
+    _async_exchange_failures.pop(name, None)
+    _ASYNC_EXCHANGES[name] = ex
     return ex
 
-_ohlcv_cache = TTLCache(maxsize=256, ttl=300)
-@cached(_ohlcv_cache)
-def fetch_ohlcv_cached(symbol: str, timeframe: str = "1h", limit: int = 500, exchange: str = "binance") -> pd.DataFrame:
+async def get_async_exchange(name: str = "binance"):
+    """Return the shared ccxt.async_support exchange, loading markets on first use."""
+    ex = _ASYNC_EXCHANGES.get(name)
+    if ex is not None:
+        return ex
+    failure = _async_exchange_failures.get(name)
+    if failure is not None and time.time() - failure[1] < EXCHANGE_INIT_RETRY_SECONDS:
+        raise failure[0]
+
+    task = _async_exchange_inflight.get(name)
+    if task is None:
+        task = asyncio.ensure_future(_init_async_exchange(name))
+        _async_exchange_inflight[name] = task
+        task.add_done_callback(lambda _: _async_exchange_inflight.pop(name, None))
+    # shield: a cancelled waiter must not cancel the load other waiters share
+    return await asyncio.shield(task)
+
+async def close_async_exchanges() -> None:
+    """Close all shared async exchanges (call from the app shutdown hook)."""
+    while _ASYNC_EXCHANGES:
+        name, ex = _ASYNC_EXCHANGES.popitem()
+        try:
+            await ex.close()
+        except Exception:
+            logger.exception("Failed to close exchange %s", name)
+
+# Freshness per OHLCV timeframe in seconds; longer bars change less often
+OHLCV_TTL_POLICY = {"1h": 60, "4h": 300, "1d": 600}
+
+def ttl_for_timeframe(timeframe: str) -> int:
+    """Cache lifetime for OHLCV of a given timeframe: the policy entry, else one bar capped at 60 seconds."""
+    ttl = OHLCV_TTL_POLICY.get(timeframe)
+    if ttl is None:
+        ttl = min(ccxt.Exchange.parse_timeframe(timeframe), 60)
+    return ttl
+
+def _ohlcv_key(symbol: str, timeframe: str = "1h", limit: int = 500, exchange: str = "binance"):
+    return (symbol, timeframe, limit, exchange)
+
+def _ohlcv_redis_key(key) -> str:
+    symbol, timeframe, limit, exchange = key
+    return f"ohlcv:{exchange}:{symbol}:{timeframe}:{limit}"
+
+@dataclass(frozen=True)
+class OHLCV:
+    """Columnar OHLCV bars: ts in epoch milliseconds, prices/volume as float64 arrays."""
+    ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    COLUMNS: ClassVar[Tuple[str, ...]] = ("ts", "open", "high", "low", "close", "volume")
+
+    def __len__(self) -> int:
+        return self.ts.shape[0]
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """Column name -> array mapping, serializable by orjson with OPT_SERIALIZE_NUMPY."""
+        return {col: getattr(self, col) for col in self.COLUMNS}
+
+    def to_frame(self) -> "pd.DataFrame":
+        """DataFrame of the same columns (ts stays int64 epoch ms), for callers that want pandas."""
+        # Imported here: pandas 2.x loads pyarrow on import, which the Redis encoding already keeps lazy
+        import pandas as pd
+        return pd.DataFrame(self.to_dict(), copy=False)
+
+    @classmethod
+    def from_columns(cls, columns) -> "OHLCV":
+        """Build from any column name -> array-like mapping (a dict of arrays or a DataFrame)."""
+        return cls(
+            ts=np.asarray(columns["ts"], dtype=np.int64),
+            open=np.asarray(columns["open"], dtype=np.float64),
+            high=np.asarray(columns["high"], dtype=np.float64),
+            low=np.asarray(columns["low"], dtype=np.float64),
+            close=np.asarray(columns["close"], dtype=np.float64),
+            volume=np.asarray(columns["volume"], dtype=np.float64),
+        )
+
+    def version(self) -> tuple:
+        """
+        Identify the state of these bars for memoizing derived values.
+
+        The last bar is still forming, so its close is part of the version alongside its timestamp.
+        """
+        return (len(self), int(self.ts[-1]), float(self.close[-1]))
+
+def _ohlcv_arrays(data: List[list], symbol: str, exchange: str) -> OHLCV:
+    """Build OHLCV arrays directly from ccxt's list-of-lists payload."""
+    if not data:
+        raise Exception(f"No OHLCV data returned for {symbol} on {exchange}")
+
+    # One typed conversion of the whole payload, then a transposed copy so each column is contiguous;
+    # epoch-ms timestamps are far below 2**53, so the float64 round trip is exact
+    cols = np.ascontiguousarray(np.asarray(data, dtype=np.float64)[:, :6].T)
+    return OHLCV(
+        ts=cols[0].astype(np.int64),
+        open=cols[1],
+        high=cols[2],
+        low=cols[3],
+        close=cols[4],
+        volume=cols[5],
+    )
+
+def _ohlcv_from_redis(redis_key: str) -> Optional[Tuple[OHLCV, bool]]:
+    """Return (bars, is_fresh) from the Redis tier, or None on a miss."""
+    entry = cache.get(redis_key)
+    if entry is None:
+        return None
+    return OHLCV.from_columns(cache.columns_from_bytes(entry.body)), entry.fresh
+
+def _ohlcv_to_redis(redis_key: str, ohlcv: OHLCV, ttl: int) -> None:
+    if not cache.enabled():
+        return
+    cache.put(redis_key, cache.columns_to_bytes(ohlcv.to_dict()), ttl)
+
+# Process-local tier in front of the shared Redis tier; entries expire per timeframe
+_ohlcv_cache = TLRUCache(maxsize=256, ttu=lambda key, value, now: now + ttl_for_timeframe(key[1]))
+# cachetools caches aren't thread-safe; executor threads and the event loop share this one
+_ohlcv_cache_lock = threading.Lock()
+
+def _ohlcv_cache_get(key) -> Optional[OHLCV]:
+    with _ohlcv_cache_lock:
+        return _ohlcv_cache.get(key)
+
+def _ohlcv_cache_put(key, ohlcv: OHLCV) -> None:
+    with _ohlcv_cache_lock:
+        _ohlcv_cache[key] = ohlcv
+
+def fetch_ohlcv_cached(symbol: str, timeframe: str = "1h", limit: int = 500, exchange: str = "binance") -> OHLCV:
     """
     Fetch OHLCV data with caching and error handling
 
@@ -63,37 +543,155 @@ def fetch_ohlcv_cached(symbol: str, timeframe: str = "1h", limit: int = 500, exc
         exchange: Exchange name
 
     Returns:
-        DataFrame with OHLCV data
+        OHLCV arrays
 
     Raises:
         Exception: If data fetch fails with descriptive error message
     """
+    key = _ohlcv_key(symbol, timeframe, limit, exchange)
+    ohlcv = _ohlcv_cache_get(key)
+    if ohlcv is not None:
+        return ohlcv
+
+    lock = _sync_key_lock(("ohlcv",) + key)
+    with lock:
+        # Another thread may have filled the entry while we waited for the lock
+        ohlcv = _ohlcv_cache_get(key)
+        if ohlcv is not None:
+            return ohlcv
+        return _load_ohlcv(key)
+
+def _load_ohlcv(key) -> OHLCV:
+    symbol, timeframe, limit, exchange = key
+    redis_key = _ohlcv_redis_key(key)
+    shared = _ohlcv_from_redis(redis_key)
+    if shared is not None and shared[1]:
+        _ohlcv_cache_put(key, shared[0])
+        return shared[0]
+
     try:
         start = time.time()
         ex = get_exchange(exchange)
+        if exchange == "binance":
+            _binance_limiter.acquire()
         data = ex.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit)
-        if not data:
-            raise Exception(f"No OHLCV data returned for {symbol} on {exchange}")
+        ohlcv = _ohlcv_arrays(data, symbol, exchange)
+    except Exception as e:
+        logger.exception("Failed to fetch OHLCV for %s %s on %s", symbol, timeframe, exchange)
+        if shared is not None:
+            logger.warning("Returning stale OHLCV for %s %s on %s due to fetch error", symbol, timeframe, exchange)
+            return shared[0]
+        raise Exception(f"Failed to fetch OHLCV data for {symbol} from {exchange}: {str(e)}")
+    finally:
+        logger.info("fetch_ohlcv_cached %s %s took %.2fs", symbol, timeframe, time.time() - start)
+
+    _ohlcv_cache_put(key, ohlcv)
+    _ohlcv_to_redis(redis_key, ohlcv, ttl_for_timeframe(timeframe))
+    return ohlcv
+
+# In-flight async OHLCV fetches, so concurrent misses for the same key share one upstream call
+_ohlcv_inflight: Dict[tuple, "asyncio.Task"] = {}
+
+async def fetch_ohlcv_async(symbol: str, timeframe: str = "1h", limit: int = 500, exchange: str = "binance") -> OHLCV:
+    """
+    Async variant of fetch_ohlcv_cached using ccxt.async_support; shares the same cache.
+
+    Concurrent calls for the same (symbol, timeframe, limit, exchange) are coalesced
+    into a single upstream fetch.
+
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTC/USDT')
+        timeframe: Timeframe for data (e.g., '1h', '4h', '1d')
+        limit: Number of candles to fetch
+        exchange: Exchange name
+
+    Returns:
+        OHLCV arrays
+
+    Raises:
+        Exception: If data fetch fails with descriptive error message
+    """
+    key = _ohlcv_key(symbol, timeframe, limit, exchange)
+    ohlcv = _ohlcv_cache_get(key)
+    if ohlcv is not None:
+        return ohlcv
+
+    task = _ohlcv_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_load_ohlcv_async(key))
+        _ohlcv_inflight[key] = task
+        task.add_done_callback(lambda _: _ohlcv_inflight.pop(key, None))
+    # shield: a cancelled waiter must not cancel the fetch other waiters share
+    return await asyncio.shield(task)
+
+async def fetch_ohlcv_multi(symbol: str, timeframes: Tuple[str, ...] = ("1h", "4h", "1d"), limit: int = 500,
+                            exchange: str = "binance") -> Dict[str, OHLCV]:
+    """
+    Fetch several timeframes of one symbol concurrently.
+
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTC/USDT')
+        timeframes: Timeframes to fetch
+        limit: Number of candles per timeframe
+        exchange: Exchange name
+
+    Returns:
+        Dict mapping each timeframe to its OHLCV arrays
 
-        df = pd.DataFrame(data, columns=["ts", "open", "high", "low", "close", "volume"])
-        df["ts"] = pd.to_datetime(df["ts"], unit="ms")
+    Raises:
+        Exception: If any timeframe fails, as fetch_ohlcv_async does
+    """
+    results = await asyncio.gather(*[fetch_ohlcv_async(symbol, tf, limit, exchange) for tf in timeframes])
+    return dict(zip(timeframes, results))
 
-        if df.empty:
-            raise Exception(f"Empty OHLCV data received for {symbol} on {exchange}")
+async def _load_ohlcv_async(key) -> OHLCV:
+    symbol, timeframe, limit, exchange = key
+    redis_key = _ohlcv_redis_key(key)
+    shared = await asyncio.to_thread(_ohlcv_from_redis, redis_key)
+    if shared is not None and shared[1]:
+        _ohlcv_cache_put(key, shared[0])
+        return shared[0]
 
-        return df
+    start = time.time()
+    try:
+        ex = await get_async_exchange(exchange)
+        if exchange == "binance":
+            await _binance_limiter.acquire_async()
+        data = await ex.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit)
+        ohlcv = _ohlcv_arrays(data, symbol, exchange)
     except Exception as e:
         logger.exception("Failed to fetch OHLCV for %s %s on %s", symbol, timeframe, exchange)
+        if shared is not None:
+            logger.warning("Returning stale OHLCV for %s %s on %s due to fetch error", symbol, timeframe, exchange)
+            return shared[0]
         raise Exception(f"Failed to fetch OHLCV data for {symbol} from {exchange}: {str(e)}")
     finally:
-        logger.info("fetch_ohlcv_cached %s %s took %.2fs", symbol, timeframe, time.time() - start)
+        logger.info("fetch_ohlcv_async %s %s took %.2fs", symbol, timeframe, time.time() - start)
+
+    _ohlcv_cache_put(key, ohlcv)
+    await asyncio.to_thread(_ohlcv_to_redis, redis_key, ohlcv, ttl_for_timeframe(timeframe))
+    return ohlcv
+
+def _parse_premium_index(data: Dict[str, Any], symbol: str) -> Optional[Dict[str, Any]]:
+    """Normalize a Binance premiumIndex payload into the funding rate dict."""
+    if not data:
+        logger.warning("Empty funding rate response for %s", symbol)
+        return None
+
+    return {
+        "symbol": data.get("symbol"),
+        "markPrice": float(data.get("markPrice", 0.0)),
+        "lastFundingRate": float(data.get("lastFundingRate", 0.0)),
+        "nextFundingTime": int(data.get("nextFundingTime", 0)),
+        "time": int(data.get("time", 0)),
+    }
 
 def fetch_funding_rate(symbol: str, exchange: str = "binance") -> Optional[Dict[str, Any]]:
     """
     Fetch funding rate data from exchange
 
     Args:
-        symbol: Symbol without slash (e.g., 'ETHUSDT' for Binance)
+        symbol: Normalized symbol (see normalize_symbol, e.g., 'ETHUSDT' for Binance); sent as is
         exchange: Exchange name
 
     Returns:
@@ -103,24 +701,12 @@ def fetch_funding_rate(symbol: str, exchange: str = "binance") -> Optional[Dict[
         Binance returns lastFundingRate as decimal (0.0001 = 0.01%)
     """
     if exchange.lower() == "binance":
-        url = "https://fapi.binance.com/fapi/v1/premiumIndex"
-        params = {"symbol": symbol.replace("/", "").upper()}
+        params = {"symbol": symbol}
         try:
-            r = requests.get(url, params=params, timeout=10)
+            _binance_limiter.acquire()
+            r = _http.get(BINANCE_PREMIUM_INDEX_URL, params=params, timeout=10)
             r.raise_for_status()
-            data = r.json()
-
-            if not data:
-                logger.warning("Empty funding rate response for %s", symbol)
-                return None
-
-            return {
-                "symbol": data.get("symbol"),
-                "markPrice": float(data.get("markPrice", 0.0)),
-                "lastFundingRate": float(data.get("lastFundingRate", 0.0)),
-                "nextFundingTime": int(data.get("nextFundingTime", 0)),
-                "time": int(data.get("time", 0)),
-            }
+            return _parse_premium_index(orjson.loads(r.content), symbol)
         except requests.exceptions.RequestException as e:
             logger.warning("Network error fetching funding rate for %s: %s", symbol, str(e))
             return None
@@ -133,3 +719,60 @@ def fetch_funding_rate(symbol: str, exchange: str = "binance") -> Optional[Dict[
     else:
         logger.info("Funding rate not supported for exchange: %s", exchange)
         return None
+
+async def fetch_funding_rate_async(symbol: str, exchange: str = "binance") -> Optional[Dict[str, Any]]:
+    """
+    Async variant of fetch_funding_rate using httpx.
+
+    Args:
+        symbol: Normalized symbol (see normalize_symbol, e.g., 'ETHUSDT' for Binance); sent as is
+        exchange: Exchange name
+
+    Returns:
+        Dict with funding rate data or None if failed
+    """
+    if exchange.lower() == "binance":
+        params = {"symbol": symbol}
+        try:
+            await _binance_limiter.acquire_async()
+            r = await _get_async_http().get(BINANCE_PREMIUM_INDEX_URL, params=params)
+            r.raise_for_status()
+            return _parse_premium_index(orjson.loads(r.content), symbol)
+        except httpx.HTTPError as e:
+            logger.warning("Network error fetching funding rate for %s: %s", symbol, str(e))
+            return None
+        except (ValueError, KeyError) as e:
+            logger.error("Data parsing error for funding rate %s: %s", symbol, str(e))
+            return None
+        except Exception as e:
+            logger.exception("Unexpected error fetching funding rate for %s: %s", symbol, str(e))
+            return None
+    else:
+        logger.info("Funding rate not supported for exchange: %s", exchange)
+        return None
+
+async def fetch_all_funding_rates_async(exchange: str = "binance") -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch funding rates for every listed symbol in one request.
+
+    Args:
+        exchange: Exchange name
+
+    Returns:
+        Dict mapping symbol (e.g., 'BTCUSDT') to its funding rate data; empty if failed
+    """
+    if exchange.lower() != "binance":
+        logger.info("Funding rate not supported for exchange: %s", exchange)
+        return {}
+    try:
+        # Without a symbol param premiumIndex returns the whole list
+        await _binance_limiter.acquire_async(PREMIUM_INDEX_ALL_COST)
+        r = await _get_async_http().get(BINANCE_PREMIUM_INDEX_URL)
+        r.raise_for_status()
+        items = orjson.loads(r.content)
+        return {item["symbol"]: _parse_premium_index(item, item["symbol"]) for item in items}
+    except httpx.HTTPError as e:
+        logger.warning("Network error fetching all funding rates: %s", str(e))
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error("Data parsing error for all funding rates: %s", str(e))
+    return {}
@@ -1,19 +1,149 @@
+from dataclasses import dataclass
 import numpy as np
-import pandas as pd
+from scipy.signal import lfilter
+from ._jit import njit
 
-def rsi(series: pd.Series, period: int = 14) -> pd.Series:
-    delta = series.diff()
+def _ema(x: np.ndarray, alpha: float) -> np.ndarray:
+    # Same recurrence as pandas ewm(adjust=False): y[0] = x[0], y[t] = alpha*x[t] + (1-alpha)*y[t-1]
+    if x.size == 0:
+        return x.copy()
+    y, _ = lfilter([alpha], [1.0, alpha - 1.0], x, zi=[(1.0 - alpha) * x[0]])
+    return y
+
+def bfill(x: np.ndarray) -> np.ndarray:
+    """Backward-fill NaNs with the next valid value (trailing NaNs are kept)."""
+    mask = np.isnan(x)
+    if not mask.any():
+        return x
+    n = x.size
+    idx = np.where(mask, n, np.arange(n))
+    idx = np.minimum.accumulate(idx[::-1])[::-1]
+    return np.append(x, np.nan)[idx]
+
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    close = np.asarray(close, dtype=np.float64)
+    delta = np.diff(close, prepend=close[:1])
     gain = np.where(delta > 0, delta, 0.0)
     loss = np.where(delta < 0, -delta, 0.0)
-    roll_up = pd.Series(gain, index=series.index).ewm(alpha=1/period, adjust=False).mean()
-    roll_down = pd.Series(loss, index=series.index).ewm(alpha=1/period, adjust=False).mean()
+    roll_up = _ema(gain, 1 / period)
+    roll_down = _ema(loss, 1 / period)
     rs = roll_up / (roll_down + 1e-10)
     return 100 - (100 / (1 + rs))
 
-def macd(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9):
-    ema_fast = series.ewm(span=fast, adjust=False).mean()
-    ema_slow = series.ewm(span=slow, adjust=False).mean()
+def macd(close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9):
+    close = np.asarray(close, dtype=np.float64)
+    ema_fast = _ema(close, 2 / (fast + 1))
+    ema_slow = _ema(close, 2 / (slow + 1))
     dif = ema_fast - ema_slow
-    dea = dif.ewm(span=signal, adjust=False).mean()
+    dea = _ema(dif, 2 / (signal + 1))
     hist = dif - dea
     return dif, dea, hist
+
+RSI_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL = 14, 12, 26, 9
+
+@dataclass(frozen=True)
+class IndicatorState:
+    """
+    RSI/MACD recurrences after the bar at ts, enough to extend them one close at a time.
+
+    seed_ts is the bar the recurrences were seeded from; the values only equal rsi()/macd() over
+    a series that starts at that same bar.
+    """
+    ts: int
+    seed_ts: int
+    close: float
+    avg_gain: float
+    avg_loss: float
+    ema_fast: float
+    ema_slow: float
+    dea: float
+
+@njit("UniTuple(float64, 5)(float64[::1], int64, int64, int64, int64, float64, float64, float64, float64, float64)",
+      cache=True)
+def _rsi_macd_state(close, period, fast, slow, signal, avg_gain, avg_loss, ema_fast, ema_slow, dea):
+    """
+    One fused pass of the rsi()/macd() recurrences, returning only their final values.
+
+    The recurrences start from the given values at close[0] and are advanced over close[1:].
+
+    Returns:
+        (avg_gain, avg_loss, ema_fast, ema_slow, dea) after the last close
+    """
+    a_rsi = 1.0 / period
+    a_fast = 2.0 / (fast + 1)
+    a_slow = 2.0 / (slow + 1)
+    a_sig = 2.0 / (signal + 1)
+    for i in range(1, close.shape[0]):
+        delta = close[i] - close[i - 1]
+        avg_gain = a_rsi * max(delta, 0.0) + (1.0 - a_rsi) * avg_gain
+        avg_loss = a_rsi * max(-delta, 0.0) + (1.0 - a_rsi) * avg_loss
+        ema_fast = a_fast * close[i] + (1.0 - a_fast) * ema_fast
+        ema_slow = a_slow * close[i] + (1.0 - a_slow) * ema_slow
+        dea = a_sig * (ema_fast - ema_slow) + (1.0 - a_sig) * dea
+    return avg_gain, avg_loss, ema_fast, ema_slow, dea
+
+def indicator_state(close: np.ndarray, ts: int = 0, seed_ts: int = 0) -> IndicatorState:
+    """Run the full-series recurrences over close and keep their final values, tagged with the last and first bars' ts."""
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    # Seeds as in _ema: the first delta is 0 and every EMA starts at its first input
+    avg_gain, avg_loss, ema_fast, ema_slow, dea = _rsi_macd_state(
+        close, RSI_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL, 0.0, 0.0, close[0], close[0], 0.0)
+    return IndicatorState(
+        ts=int(ts),
+        seed_ts=int(seed_ts),
+        close=float(close[-1]),
+        avg_gain=avg_gain,
+        avg_loss=avg_loss,
+        ema_fast=ema_fast,
+        ema_slow=ema_slow,
+        dea=dea,
+    )
+
+def extend_state(state: IndicatorState, close: np.ndarray, ts: int) -> IndicatorState:
+    """
+    Advance state over new bars in one compiled pass; close[0] is the state's own bar, ts the last bar's.
+
+    Only this tail of closes is touched, so catching up costs O(new bars) however long the series is.
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    avg_gain, avg_loss, ema_fast, ema_slow, dea = _rsi_macd_state(
+        close, RSI_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL,
+        state.avg_gain, state.avg_loss, state.ema_fast, state.ema_slow, state.dea)
+    return IndicatorState(
+        ts=int(ts),
+        seed_ts=state.seed_ts,
+        close=float(close[-1]),
+        avg_gain=avg_gain,
+        avg_loss=avg_loss,
+        ema_fast=ema_fast,
+        ema_slow=ema_slow,
+        dea=dea,
+    )
+
+def rsi_macd_latest(close: np.ndarray):
+    """Return the last (rsi, dif, dea, hist) of rsi(close) and macd(close) without building the series."""
+    return state_values(indicator_state(close))
+
+def advance_state(state: IndicatorState, ts: int, close: float) -> IndicatorState:
+    """One EMA step of every recurrence for the next bar; matches indicator_state over the longer series."""
+    a_rsi = 1 / RSI_PERIOD
+    a_fast, a_slow, a_sig = 2 / (MACD_FAST + 1), 2 / (MACD_SLOW + 1), 2 / (MACD_SIGNAL + 1)
+    delta = close - state.close
+    ema_fast = a_fast * close + (1 - a_fast) * state.ema_fast
+    ema_slow = a_slow * close + (1 - a_slow) * state.ema_slow
+    return IndicatorState(
+        ts=int(ts),
+        seed_ts=state.seed_ts,
+        close=float(close),
+        avg_gain=a_rsi * max(delta, 0.0) + (1 - a_rsi) * state.avg_gain,
+        avg_loss=a_rsi * max(-delta, 0.0) + (1 - a_rsi) * state.avg_loss,
+        ema_fast=ema_fast,
+        ema_slow=ema_slow,
+        dea=a_sig * (ema_fast - ema_slow) + (1 - a_sig) * state.dea,
+    )
+
+def state_values(state: IndicatorState):
+    """Return (rsi, dif, dea, hist) at the state's bar, computed as rsi() and macd() do."""
+    rs = state.avg_gain / (state.avg_loss + 1e-10)
+    dif = state.ema_fast - state.ema_slow
+    return 100 - (100 / (1 + rs)), dif, state.dea, dif - state.dea
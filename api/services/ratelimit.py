@@ -0,0 +1,66 @@
+"""
+Client-side token bucket for outbound exchange calls, shared by the sync and async paths, and
+per-key access counting used to decide which cache entries are worth refreshing ahead of time
+"""
+import time
+import asyncio
+import threading
+from typing import Dict, Hashable
+
+class TokenBucket:
+    """
+    Allow up to rpm requests per minute, refilled continuously.
+
+    Callers reserve tokens up front, so the bucket can go negative; each caller then waits
+    for its own slot and concurrent callers come out evenly spaced instead of in a burst.
+    """
+
+    def __init__(self, rpm: float):
+        self.rpm = float(rpm)
+        self.tokens = self.rpm
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, cost: float) -> float:
+        """Take cost tokens and return how long to wait before they are actually available."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.rpm, self.tokens + (now - self.last) * self.rpm / 60.0)
+            self.last = now
+            self.tokens -= cost
+            return max(0.0, -self.tokens) * 60.0 / self.rpm
+
+    def acquire(self, cost: float = 1) -> None:
+        wait = self._reserve(cost)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, cost: float = 1) -> None:
+        wait = self._reserve(cost)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+class BucketTimeRate:
+    """Per-key hit counts over a sliding window of one-minute buckets."""
+
+    def __init__(self, minutes: int = 5):
+        self.minutes = minutes
+        self._buckets: Dict[int, Dict[Hashable, int]] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key: Hashable) -> None:
+        minute = int(time.time() // 60)
+        with self._lock:
+            bucket = self._buckets.get(minute)
+            if bucket is None:
+                # New minute: drop buckets that have slid out of the window
+                for old in [m for m in self._buckets if m <= minute - self.minutes]:
+                    del self._buckets[old]
+                bucket = self._buckets[minute] = {}
+            bucket[key] = bucket.get(key, 0) + 1
+
+    def count(self, key: Hashable) -> int:
+        """Hits for key within the last `minutes` minutes, including the current one."""
+        oldest = int(time.time() // 60) - self.minutes
+        with self._lock:
+            return sum(bucket.get(key, 0) for minute, bucket in self._buckets.items() if minute > oldest)
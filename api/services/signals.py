@@ -1,19 +1,35 @@
 """
 Signal calculation service to avoid code duplication between API and frontend
 """
-from typing import Dict, List, Tuple, Any
-import pandas as pd
-from .indicators import rsi, macd
-from .exchanges import fetch_funding_rate, fetch_funding_rate_cached
+import threading
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
+from cachetools import TTLCache, LRUCache
+from .indicators import (
+    rsi_macd_latest, IndicatorState, indicator_state, extend_state, advance_state, state_values,
+)
+from ._jit import njit
+from .exchanges import fetch_funding_rate_cached, fetch_funding_rate_cached_async, normalize_symbol, OHLCV
 
-def calculate_signal(df: pd.DataFrame, symbol: str, exchange: str = "binance") -> Dict[str, Any]:
+# Signal dicts keyed on the OHLCV frame and funding rate they were computed from
+_signal_cache = TTLCache(maxsize=1024, ttl=300)
+
+# (symbol, timeframe, exchange, first bar ts) -> indicator state at the last closed bar seen. Callers with
+# different limits start at different bars, so they keep separate states; the lock is needed because
+# the sync path runs in executor threads and LRUCache reorders itself on every read
+_indicator_state: "LRUCache[Tuple[str, str, str, int], IndicatorState]" = LRUCache(maxsize=1024)
+_indicator_state_lock = threading.Lock()
+
+def calculate_signal(ohlcv: OHLCV, symbol: str, exchange: str = "binance",
+                     timeframe: str = "1h") -> Dict[str, Any]:
     """
     Calculate trading signal based on RSI, MACD, and funding rate
 
     Args:
-        df: OHLCV DataFrame with close prices
+        ohlcv: OHLCV bars
         symbol: Trading pair symbol
         exchange: Exchange name
+        timeframe: Timeframe of the bars, keys the incremental indicator state
 
     Returns:
         Dict containing signal data: action, reasons, scores, levels
@@ -21,51 +37,127 @@ def calculate_signal(df: pd.DataFrame, symbol: str, exchange: str = "binance") -
     Raises:
         Exception: If signal calculation fails
     """
+    # Get funding rate with caching (5-minute cache)
     try:
-        close = df["close"]
-        rsi_v = rsi(close)
-        dif, dea, hist = macd(close)
+        funding = fetch_funding_rate_cached(normalize_symbol(symbol), exchange=exchange, cache_seconds=300)
+    except Exception as e:
+        raise Exception(f"Signal calculation failed: {str(e)}")
+    return _build_signal(ohlcv, funding, (symbol, timeframe, exchange))
+
+async def calculate_signal_async(ohlcv: OHLCV, symbol: str, exchange: str = "binance",
+                                 timeframe: str = "1h") -> Dict[str, Any]:
+    """
+    Async variant of calculate_signal; the funding rate is fetched without blocking the event loop.
+
+    Results are memoized per (symbol, timeframe, exchange, OHLCV frame version, funding rate),
+    so repeated polls within the same bar skip the indicator work.
+    """
+    try:
+        funding = await fetch_funding_rate_cached_async(normalize_symbol(symbol), exchange=exchange, cache_seconds=300)
+    except Exception as e:
+        raise Exception(f"Signal calculation failed: {str(e)}")
+
+    key = (symbol, timeframe, exchange, funding.get("lastFundingRate") if funding else None) + ohlcv.version()
+    signal_data = _signal_cache.get(key)
+    if signal_data is None:
+        signal_data = _signal_cache[key] = _build_signal(ohlcv, funding, (symbol, timeframe, exchange))
+    return signal_data
+
+# Action codes returned by _decide
+ACTION_WAIT, ACTION_BUY, ACTION_SELL = 0, 1, 2
 
+SELL_REASONS = (
+    "RSI>75 overbought",
+    "Funding>0.05% long overheated",
+    "MACD histogram turned negative, momentum weakening",
+)
+BUY_REASONS = (
+    "RSI<40 oversold",
+    "Funding<0 short overheated",
+    "MACD histogram turned positive, momentum recovering",
+)
+WAIT_REASONS = ("No confluence detected",)
+
+# action code -> (action, reasons)
+_OUTCOMES = {
+    ACTION_SELL: ("sell", SELL_REASONS),
+    ACTION_BUY: ("buy", BUY_REASONS),
+    ACTION_WAIT: ("wait", WAIT_REASONS),
+}
+
+# Explicit signature: compiled eagerly at import (or loaded from the on-disk cache),
+# so the first /api/signals request doesn't pay the JIT pause
+@njit("Tuple((int64, float64, float64))(float64[:], float64[:], float64, float64, float64, int64)",
+      cache=True)
+def _decide(high, low, rsi_latest, hist_latest, funding_rate, window):
+    """Return (action_code, support, resistance) from the latest indicator values and the last window bars."""
+    # Sell signal: RSI overbought + positive funding rate (long overheated) + MACD negative momentum
+    if rsi_latest > 75 and funding_rate > 0.0005 and hist_latest < 0:
+        action = ACTION_SELL
+    # Buy signal: RSI oversold + negative funding rate (short overheated) + MACD positive momentum
+    elif rsi_latest < 40 and funding_rate < 0 and hist_latest > 0:
+        action = ACTION_BUY
+    else:
+        action = ACTION_WAIT
+
+    # Support/resistance over the trailing window; slice reductions stay vectorized without numba
+    support = low[-window:].min()
+    resistance = high[-window:].max()
+
+    return action, support, resistance
+
+def _latest_indicators(ohlcv: OHLCV, state_key: Tuple[str, str, str]) -> Tuple[float, float, float, float]:
+    """
+    Return the latest (rsi, dif, dea, hist), extending the stored state instead of rescanning the series.
+
+    The state sits at the last closed bar; the forming bar's close keeps changing, so it is applied
+    on top without being stored. States are keyed on the series' first bar, since the values only
+    equal rsi(close)[-1] / macd(close)[-1] over a series seeded from that bar: a series growing from a
+    fixed start catches up over just its new bars, while a fixed-limit window that slid forward starts
+    at a new bar and is rebuilt from the full series (as is a first call or a gap).
+    """
+    ts, close = ohlcv.ts, ohlcv.close
+    n = len(ohlcv)
+    if n < 2:
+        return rsi_macd_latest(close)
+
+    key = state_key + (int(ts[0]),)
+    with _indicator_state_lock:
+        state = _indicator_state.get(key)
+    i = n
+    if state is not None:
+        i = int(np.searchsorted(ts, state.ts))
+    if i >= n - 1 or ts[i] != state.ts:
+        # Cold path: no usable state, rebuild from the whole series
+        state = indicator_state(close[:-1], ts[-2], ts[0])
+    elif i < n - 2:
+        # Warm path: only the bars closed since the state are read
+        state = extend_state(state, close[i:n - 1], ts[-2])
+    with _indicator_state_lock:
+        _indicator_state[key] = state
+
+    rsi_latest, dif, dea, hist = state_values(advance_state(state, ts[-1], close[-1]))
+    return float(rsi_latest), float(dif), float(dea), float(hist)
+
+def _build_signal(ohlcv: OHLCV, funding: Optional[Dict[str, Any]],
+                  state_key: Tuple[str, str, str]) -> Dict[str, Any]:
+    """Combine indicators on the bars with an already-fetched funding payload into the signal dict."""
+    try:
         # Get latest indicator values
-        rsi_latest = float(rsi_v.iloc[-1])
-        hist_latest = float(hist.iloc[-1])
-        dif_latest = float(dif.iloc[-1])
-        dea_latest = float(dea.iloc[-1])
+        rsi_latest, dif_latest, dea_latest, hist_latest = _latest_indicators(ohlcv, state_key)
 
-        # Get funding rate with caching (5-minute cache)
-        funding = fetch_funding_rate_cached(symbol.replace("/", ""), exchange=exchange, cache_seconds=300)
         funding_rate = float(funding["lastFundingRate"]) if funding and "lastFundingRate" in funding else 0.0
 
-        # Calculate signal
-        reasons, action = [], "wait"
-
-        # Sell signal: RSI overbought + positive funding rate (long overheated) + MACD negative momentum
-        if (rsi_latest > 75 and funding_rate > 0.0005 and hist_latest < 0):
-            action = "sell"
-            reasons += [
-                "RSI>75 overbought",
-                "Funding>0.05% long overheated",
-                "MACD histogram turned negative, momentum weakening"
-            ]
-        # Buy signal: RSI oversold + negative funding rate (short overheated) + MACD positive momentum
-        elif (rsi_latest < 40 and funding_rate < 0 and hist_latest > 0):
-            action = "buy"
-            reasons += [
-                "RSI<40 oversold",
-                "Funding<0 short overheated",
-                "MACD histogram turned positive, momentum recovering"
-            ]
-        else:
-            reasons += ["No confluence detected"]
-
-        # Calculate support/resistance levels
-        window = min(60, len(df))
-        support = float(df["low"].tail(window).min())
-        resistance = float(df["high"].tail(window).max())
+        # Calculate signal and support/resistance levels
+        window = min(60, len(ohlcv))
+        action_code, support, resistance = _decide(ohlcv.high, ohlcv.low, rsi_latest, hist_latest, funding_rate, window)
+        support, resistance = float(support), float(resistance)
+
+        action, reasons = _OUTCOMES[action_code]
 
         return {
             "action": action,
-            "reasons": reasons,
+            "reasons": list(reasons),
             "scores": {
                 "rsi": rsi_latest,
                 "funding": funding_rate,
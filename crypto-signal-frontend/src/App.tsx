@@ -1,4 +1,4 @@
-import { useEffect, useMemo, useState, useCallback } from 'react'
+import { useEffect, useMemo, useState, useCallback, useRef } from 'react'
 import './App.css'
 import createPlotlyComponent from 'react-plotly.js/factory'
 import Plotly from 'plotly.js-finance-dist'
@@ -10,6 +10,14 @@ const Plot = createPlotlyComponent(Plotly)
 const plotConfig = { scrollZoom: true, displayModeBar: true, responsive: true, doubleClick: 'reset' } as const
 const symbols = ['BTC/USDT', 'ETH/USDT', 'SOL/USDT'] as const
 const timeframes = ['1h', '4h', '1d'] as const
+// MACD histogram bar colors indexed by (value >= 0): [negative, positive]
+const histPalette = ['rgba(239, 83, 80, 0.7)', 'rgba(38, 166, 154, 0.7)'] as const
+
+// Bars are unchanged when the newest (still forming) bar has the same timestamp and close
+const sameBars = (a: OHLCV, b: OHLCV) => {
+  const n = b.ts.length
+  return n > 0 && a.ts.length === n && a.ts[n - 1] === b.ts[n - 1] && a.close[n - 1] === b.close[n - 1]
+}
 
 // Performance optimization: Memoized thermometer component
 const Thermometer = ({ value, min, max, label, unit = '', dangerZones, type = 'neutral' }: {
@@ -206,12 +214,13 @@ const MACDIndicator = ({ dif, dea, hist, maxAbs }: { dif: number; dea: number; h
 export default function App() {
   const [symbol, setSymbol] = useState<typeof symbols[number]>('ETH/USDT')
   const [tf, setTf] = useState<typeof timeframes[number]>('1h')
-  const [ohlcv, setOhlcv] = useState<OHLCV[]>([])
+  const [ohlcv, setOhlcv] = useState<OHLCV | null>(null)
   const [inds, setInds] = useState<Indicators>({})
   const [sig, setSig] = useState<Signal | null>(null)
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState<string | null>(null)
   const [xRange, setXRange] = useState<[string | number, string | number] | null>(null)
+  const lastBars = useRef<{ key: string; bars: OHLCV } | null>(null)
 
   const load = useCallback(async () => {
     setLoading(true)
@@ -224,9 +233,15 @@ export default function App() {
         fetchIndicators(symbol, tf, 300),
         fetchSignal(symbol, tf, 300),
       ])
-      setOhlcv(o)
-      setInds(i)
-      setSig(s)
+      const key = `${symbol}|${tf}`
+      const prev = lastBars.current
+      // Mid-bar refresh: keep the previous figure inputs so the memoized figures aren't rebuilt
+      if (!prev || prev.key !== key || !sameBars(prev.bars, o)) {
+        lastBars.current = { key, bars: o }
+        setOhlcv(o)
+        setInds(i)
+      }
+      setSig(p => (p && JSON.stringify(p) === JSON.stringify(s) ? p : s))
     } catch (e: any) {
       setError(e?.message ?? 'Failed to load data')
     } finally {
@@ -238,13 +253,6 @@ export default function App() {
     load()
   }, [load])
 
-  const processedOHLCV = useMemo(() => {
-    return ohlcv.map(row => ({
-      ...row,
-      ts: new Date(row.ts).getTime(),
-    }))
-  }, [ohlcv])
-
   const macdMaxAbs = useMemo(() => {
     const hs = (inds.MACD?.hist ?? []).filter((v) => Number.isFinite(v)) as number[]
     if (!hs.length) return 1e-6
@@ -275,12 +283,9 @@ export default function App() {
   }, [])
 
   const figPrice = useMemo(() => {
-    if (!processedOHLCV.length) return undefined
-    const x = processedOHLCV.map(r => r.ts)
-    const open = processedOHLCV.map(r => r.open)
-    const high = processedOHLCV.map(r => r.high)
-    const low = processedOHLCV.map(r => r.low)
-    const close = processedOHLCV.map(r => r.close)
+    // Columns from the API feed Plotly directly (ts is epoch ms, accepted by date axes)
+    if (!ohlcv?.ts.length) return undefined
+    const { ts: x, open, high, low, close } = ohlcv
 
     const shapes: any[] = []
     if (sig) {
@@ -333,11 +338,11 @@ export default function App() {
       }],
       layout
     }
-  }, [processedOHLCV, symbol, sig, xRange, tf])
+  }, [ohlcv, symbol, sig, xRange, tf])
 
   const figInd = useMemo(() => {
-    if (!processedOHLCV.length) return undefined
-    const x = processedOHLCV.map(r => r.ts)
+    if (!ohlcv?.ts.length) return undefined
+    const x = ohlcv.ts
     const rsi = inds.RSI ?? []
     const hist = inds.MACD?.hist ?? []
 
@@ -399,7 +404,7 @@ export default function App() {
           y: hist,
           name: 'MACD Histogram',
           marker: {
-            color: hist.map(v => (v ?? 0) >= 0 ? 'rgba(38, 166, 154, 0.7)' : 'rgba(239, 83, 80, 0.7)'),
+            color: hist.map(v => histPalette[Number((v ?? 0) >= 0)]),
             line: { width: 0 }
           },
           yaxis: 'y2'
@@ -407,7 +412,7 @@ export default function App() {
       ],
       layout
     }
-  }, [processedOHLCV, inds, xRange, tf])
+  }, [ohlcv, inds, xRange, tf])
 
   const handleReset = useCallback(() => {
     setXRange(null)
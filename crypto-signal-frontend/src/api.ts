@@ -20,7 +20,8 @@ api.interceptors.response.use(
   }
 )
 
-export type OHLCV = { ts: string; open: number; high: number; low: number; close: number; volume?: number }
+// /api/ohlcv returns one array per column; ts is epoch milliseconds
+export type OHLCV = { ts: number[]; open: number[]; high: number[]; low: number[]; close: number[]; volume: number[] }
 export type Indicators = { RSI?: number[]; MACD?: { dif: number[]; dea: number[]; hist: number[] } }
 export type Signal = {
   action: 'buy' | 'sell' | 'wait'
@@ -31,7 +32,7 @@ export type Signal = {
 
 export async function fetchOHLCV(symbol: string, timeframe = '1h', limit = 300) {
   const { data } = await api.get('/ohlcv', { params: { symbol, timeframe, limit } })
-  return data.data as OHLCV[]
+  return data.data as OHLCV
 }
 
 export async function fetchIndicators(symbol: string, timeframe = '1h', limit = 300) {
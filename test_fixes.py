@@ -3,76 +3,111 @@ Test script to verify the fixes are working correctly
 """
 import sys
 import os
+import asyncio
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from api.services.exchanges import fetch_ohlcv_cached, fetch_funding_rate
+from api.services.exchanges import fetch_ohlcv_cached, fetch_funding_rate_async, normalize_symbol, close_async_http
 from api.services.signals import calculate_signal
 
-def test_funding_rate_threshold():
-    """Test that funding rate thresholds are correct"""
+SYMBOLS = ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
+
+def _run(coro):
+    """Run one async test body, closing the shared httpx client since it is bound to this loop."""
+    async def wrapper():
+        try:
+            await coro
+        finally:
+            await close_async_http()
+    asyncio.run(wrapper())
+
+async def _check_funding_rate(symbol: str):
+    funding = await fetch_funding_rate_async(normalize_symbol(symbol), "binance")
+    if funding:
+        rate = funding["lastFundingRate"]
+        print(f"{symbol} funding rate: {rate} ({rate * 100:.4f}%)")
+
+        # Test threshold logic (should be 0.0005 for sell, not 0.05)
+        if rate > 0.0005:
+            print(f"✓ Sell signal threshold triggered: {rate} > 0.0005")
+        elif rate > 0.05:
+            print(f"✗ Old threshold would trigger: {rate} > 0.05 (this should NOT happen)")
+        else:
+            print(f"✓ No funding rate trigger: {rate}")
+    else:
+        print(f"✗ Failed to fetch funding rate for {symbol}")
+
+async def funding_rate_threshold():
     print("Testing funding rate data...")
     try:
-        # Test BTC funding rate
-        funding = fetch_funding_rate("BTCUSDT", "binance")
-        if funding:
-            rate = funding["lastFundingRate"]
-            print(f"BTC funding rate: {rate} ({rate * 100:.4f}%)")
-
-            # Test threshold logic (should be 0.0005 for sell, not 0.05)
-            if rate > 0.0005:
-                print(f"✓ Sell signal threshold triggered: {rate} > 0.0005")
-            elif rate > 0.05:
-                print(f"✗ Old threshold would trigger: {rate} > 0.05 (this should NOT happen)")
-            else:
-                print(f"✓ No funding rate trigger: {rate}")
-        else:
-            print("✗ Failed to fetch funding rate")
+        await asyncio.gather(*[_check_funding_rate(sym) for sym in SYMBOLS])
     except Exception as e:
         print(f"✗ Error testing funding rate: {e}")
 
-def test_signal_calculation():
-    """Test the unified signal calculation"""
-    print("\nTesting signal calculation...")
+async def _check_signal(symbol: str):
     try:
-        # Fetch data
-        df = fetch_ohlcv_cached("BTC/USDT", "1h", 100)
-        print(f"✓ Fetched OHLCV data: {len(df)} rows")
+        # Fetch data; the sync ccxt path runs in worker threads so the symbols overlap
+        df = await asyncio.to_thread(fetch_ohlcv_cached, symbol, "1h", 100)
+        print(f"✓ Fetched {symbol} OHLCV data: {len(df)} rows")
 
         # Calculate signal
-        signal = calculate_signal(df, "BTC/USDT")
-        print(f"✓ Signal calculated: {signal['action']}")
+        signal = await asyncio.to_thread(calculate_signal, df, symbol)
+        print(f"✓ {symbol} signal calculated: {signal['action']}")
         print(f"  RSI: {signal['scores']['rsi']:.2f}")
         print(f"  Funding: {signal['scores']['funding']:.6f} ({signal['scores']['funding'] * 100:.4f}%)")
         print(f"  MACD Hist: {signal['scores']['macd_hist']:.6f}")
         print(f"  Reasons: {'; '.join(signal['reasons'])}")
 
     except Exception as e:
-        print(f"✗ Error testing signal calculation: {e}")
+        print(f"✗ Error testing signal calculation for {symbol}: {e}")
 
-def test_error_handling():
-    """Test error handling for invalid symbols"""
-    print("\nTesting error handling...")
+async def signal_calculation():
+    print("\nTesting signal calculation...")
+    await asyncio.gather(*[_check_signal(sym) for sym in SYMBOLS])
+
+async def _check_invalid_ohlcv():
+    # Test invalid OHLCV symbol (this should raise an exception)
     try:
-        # Test invalid symbol
-        funding = fetch_funding_rate("INVALID", "binance")
-        if funding is None:
-            print("✓ Correctly handled invalid funding rate symbol")
-        else:
-            print("✗ Should have returned None for invalid symbol")
+        await asyncio.to_thread(fetch_ohlcv_cached, "INVALID/SYMBOL", "1h", 10)
+        print("✗ Should have raised exception for invalid OHLCV symbol")
+    except Exception as e:
+        print(f"✓ Correctly handled invalid OHLCV symbol: {str(e)[:50]}...")
 
-        # Test invalid OHLCV symbol (this should raise an exception)
-        try:
-            df = fetch_ohlcv_cached("INVALID/SYMBOL", "1h", 10)
-            print("✗ Should have raised exception for invalid OHLCV symbol")
-        except Exception as e:
-            print(f"✓ Correctly handled invalid OHLCV symbol: {str(e)[:50]}...")
+async def _check_invalid_funding():
+    # Test invalid symbol
+    funding = await fetch_funding_rate_async("INVALID", "binance")
+    if funding is None:
+        print("✓ Correctly handled invalid funding rate symbol")
+    else:
+        print("✗ Should have returned None for invalid symbol")
 
+async def error_handling():
+    print("\nTesting error handling...")
+    try:
+        await asyncio.gather(_check_invalid_funding(), _check_invalid_ohlcv())
     except Exception as e:
         print(f"✗ Unexpected error in error handling test: {e}")
 
-if __name__ == "__main__":
+def test_funding_rate_threshold():
+    """Test that funding rate thresholds are correct"""
+    _run(funding_rate_threshold())
+
+def test_signal_calculation():
+    """Test the unified signal calculation"""
+    _run(signal_calculation())
+
+def test_error_handling():
+    """Test error handling for invalid symbols"""
+    _run(error_handling())
+
+async def main():
     print("=== Testing Crypto Signal Fixes ===")
-    test_funding_rate_threshold()
-    test_signal_calculation()
-    test_error_handling()
+    try:
+        await funding_rate_threshold()
+        await signal_calculation()
+        await error_handling()
+    finally:
+        await close_async_http()
     print("\n=== Test Complete ===")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,177 @@
+"""
+Freshness, stale-fallback and hard-TTL rules of the cached funding rate lookups
+"""
+import time
+import asyncio
+import orjson
+import pytest
+
+from api.services import cache
+from api.services import exchanges as E
+
+SYMBOL = "BTCUSDT"
+KEY = E._funding_key(SYMBOL, "binance")
+DATA = {"symbol": SYMBOL, "lastFundingRate": 0.0001, "nextFundingTime": 0}
+NEW = {"symbol": SYMBOL, "lastFundingRate": 0.0003, "nextFundingTime": 0}
+
+class FakeRedis:
+    """The hash commands cache.get/put use, backed by a dict."""
+
+    def __init__(self):
+        self.data = {}
+
+    def hgetall(self, key):
+        return self.data.get(key, {})
+
+    def pipeline(self):
+        return self
+
+    def hset(self, key, mapping):
+        self.data[key] = {k.encode(): v if isinstance(v, bytes) else str(v).encode() for k, v in mapping.items()}
+
+    def expire(self, key, ttl):
+        pass
+
+    def execute(self):
+        pass
+
+    def put_entry(self, data, generated_at, stale_at):
+        self.hset(E._funding_redis_key(KEY), {"generated_at": generated_at, "stale_at": stale_at,
+                                              "body": orjson.dumps(data)})
+
+class Upstream:
+    """Stand-in for fetch_funding_rate: returns result, or raises it if it is an exception."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def __call__(self, symbol, exchange="binance"):
+        self.calls += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+    async def async_call(self, symbol, exchange="binance"):
+        return self(symbol, exchange)
+
+@pytest.fixture(autouse=True)
+def _isolated(monkeypatch):
+    monkeypatch.setattr(cache, "_redis", None)
+    E._funding_cache.clear()
+    yield
+    E._funding_cache.clear()
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "_redis", fake)
+    return fake
+
+def _upstream(monkeypatch, result) -> Upstream:
+    upstream = Upstream(result)
+    monkeypatch.setattr(E, "fetch_funding_rate", upstream)
+    monkeypatch.setattr(E, "fetch_funding_rate_async", upstream.async_call)
+    return upstream
+
+def _hard_ttl() -> float:
+    return E._policy_for("funding", SYMBOL).hard_ttl
+
+def _local(data, age, lifetime=300):
+    fetched_at = time.time() - age
+    E._funding_cache[KEY] = (data, fetched_at, fetched_at + lifetime)
+
+def test_fresh_local_copy_skips_fetch(monkeypatch):
+    upstream = _upstream(monkeypatch, NEW)
+    _local(DATA, age=10)
+    assert E.fetch_funding_rate_cached(SYMBOL) == DATA
+    assert upstream.calls == 0
+
+def test_fetch_stores_with_policy_lifetime(monkeypatch):
+    _upstream(monkeypatch, NEW)
+    assert E.fetch_funding_rate_cached(SYMBOL, cache_seconds=5) == NEW
+    _, fetched_at, stale_at = E._funding_cache[KEY]
+    assert stale_at - fetched_at == pytest.approx(E._policy_for("funding", SYMBOL).min_ttl, abs=1)
+
+def test_past_next_funding_time_refetches(monkeypatch):
+    upstream = _upstream(monkeypatch, NEW)
+    _local(dict(DATA, nextFundingTime=int((time.time() - 1) * 1000)), age=10)
+    assert E.fetch_funding_rate_cached(SYMBOL) == NEW
+    assert upstream.calls == 1
+
+@pytest.mark.parametrize("failure", [None, RuntimeError("upstream down")])
+def test_stale_local_within_hard_ttl_is_served(monkeypatch, failure):
+    _upstream(monkeypatch, failure)
+    _local(DATA, age=_hard_ttl() - 60)
+    assert E.fetch_funding_rate_cached(SYMBOL) == DATA
+
+def test_stale_local_beyond_hard_ttl_returns_none(monkeypatch):
+    _upstream(monkeypatch, None)
+    _local(DATA, age=_hard_ttl() + 60)
+    assert E.fetch_funding_rate_cached(SYMBOL) is None
+
+def test_stale_local_beyond_hard_ttl_reraises(monkeypatch):
+    _upstream(monkeypatch, RuntimeError("upstream down"))
+    _local(DATA, age=_hard_ttl() + 60)
+    with pytest.raises(RuntimeError):
+        E.fetch_funding_rate_cached(SYMBOL)
+
+def test_no_copy_at_all(monkeypatch):
+    _upstream(monkeypatch, None)
+    assert E.fetch_funding_rate_cached(SYMBOL) is None
+    _upstream(monkeypatch, RuntimeError("upstream down"))
+    with pytest.raises(RuntimeError):
+        E.fetch_funding_rate_cached(SYMBOL)
+
+def test_fresh_redis_copy_fills_local_tier(monkeypatch, redis):
+    upstream = _upstream(monkeypatch, NEW)
+    now = time.time()
+    redis.put_entry(DATA, now - 10, now + 290)
+    assert E.fetch_funding_rate_cached(SYMBOL) == DATA
+    assert upstream.calls == 0
+    assert E._funding_cache[KEY][0] == DATA
+
+def test_redis_copy_past_next_funding_time_is_not_fresh(monkeypatch, redis):
+    upstream = _upstream(monkeypatch, NEW)
+    now = time.time()
+    redis.put_entry(dict(DATA, nextFundingTime=int((now - 1) * 1000)), now - 10, now + 290)
+    assert E.fetch_funding_rate_cached(SYMBOL) == NEW
+    assert upstream.calls == 1
+
+@pytest.mark.parametrize("failure", [None, RuntimeError("upstream down")])
+def test_stale_redis_within_hard_ttl_is_served(monkeypatch, redis, failure):
+    _upstream(monkeypatch, failure)
+    now = time.time()
+    generated_at = now - (_hard_ttl() - 60)
+    redis.put_entry(DATA, generated_at, generated_at + 300)
+    assert E.fetch_funding_rate_cached(SYMBOL) == DATA
+
+def test_stale_redis_beyond_hard_ttl_returns_none(monkeypatch, redis):
+    _upstream(monkeypatch, None)
+    generated_at = time.time() - (_hard_ttl() + 60)
+    redis.put_entry(DATA, generated_at, generated_at + 300)
+    assert E.fetch_funding_rate_cached(SYMBOL) is None
+
+def test_local_stale_copy_preferred_over_redis(monkeypatch, redis):
+    _upstream(monkeypatch, None)
+    _local(DATA, age=600)
+    generated_at = time.time() - 900
+    redis.put_entry(NEW, generated_at, generated_at + 300)
+    assert E.fetch_funding_rate_cached(SYMBOL) == DATA
+
+def test_expired_local_falls_back_to_redis_within_hard_ttl(monkeypatch, redis):
+    _upstream(monkeypatch, None)
+    _local(DATA, age=_hard_ttl() + 60)
+    generated_at = time.time() - 900
+    redis.put_entry(NEW, generated_at, generated_at + 300)
+    assert E.fetch_funding_rate_cached(SYMBOL) == NEW
+
+def test_async_path_follows_the_same_rules(monkeypatch):
+    _upstream(monkeypatch, None)
+    _local(DATA, age=_hard_ttl() - 60)
+    assert asyncio.run(E.fetch_funding_rate_cached_async(SYMBOL)) == DATA
+    _local(DATA, age=_hard_ttl() + 60)
+    assert asyncio.run(E.fetch_funding_rate_cached_async(SYMBOL)) is None
+    _upstream(monkeypatch, RuntimeError("upstream down"))
+    with pytest.raises(RuntimeError):
+        asyncio.run(E.fetch_funding_rate_cached_async(SYMBOL))
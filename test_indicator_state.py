@@ -0,0 +1,88 @@
+"""
+Incremental indicator state must give the same latest values as a full rsi()/macd() recompute
+"""
+import numpy as np
+import pytest
+
+from api.services.exchanges import OHLCV
+from api.services.indicators import rsi, macd
+from api.services import signals
+
+HOUR_MS = 3_600_000
+KEY = ("BTC/USDT", "1h", "binance")
+
+def _series(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.standard_normal(n))
+    ts = np.arange(n, dtype=np.int64) * HOUR_MS + 1_700_000_000_000
+    return ts, close
+
+def _bars(ts, close) -> OHLCV:
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    return OHLCV(ts=np.ascontiguousarray(ts), open=close, high=close + 1, low=close - 1,
+                 close=close, volume=np.ones_like(close))
+
+def _expected(close):
+    dif, dea, hist = macd(close)
+    return rsi(close)[-1], dif[-1], dea[-1], hist[-1]
+
+def _check(ohlcv: OHLCV):
+    got = signals._latest_indicators(ohlcv, KEY)
+    np.testing.assert_allclose(got, _expected(ohlcv.close), rtol=1e-9, atol=1e-9)
+
+@pytest.fixture(autouse=True)
+def _clear_state():
+    signals._indicator_state.clear()
+    yield
+    signals._indicator_state.clear()
+
+@pytest.fixture
+def paths(monkeypatch):
+    """Count cold rebuilds and warm catch-ups taken by _latest_indicators."""
+    counts = {"cold": 0, "warm": 0}
+
+    def counted(name, fn):
+        def wrapper(*args, **kwargs):
+            counts[name] += 1
+            return fn(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(signals, "indicator_state", counted("cold", signals.indicator_state))
+    monkeypatch.setattr(signals, "extend_state", counted("warm", signals.extend_state))
+    return counts
+
+def test_short_limit_first_does_not_seed_longer_series():
+    ts, close = _series(300)
+    _check(_bars(ts[-30:], close[-30:]))
+    _check(_bars(ts, close))
+
+def test_mixed_limits_interleaved():
+    ts, close = _series(400)
+    for end in range(300, 320):
+        for limit in (30, 100, 300):
+            _check(_bars(ts[end - limit:end], close[end - limit:end]))
+
+def test_sliding_window(paths):
+    ts, close = _series(400)
+    for end in range(200, 260):
+        _check(_bars(ts[end - 200:end], close[end - 200:end]))
+    # Each slide starts at a new bar, so nothing is reused: fixed-limit windows pay a full pass per candle
+    assert paths == {"cold": 60, "warm": 0}
+
+def test_growing_series_and_forming_bar(paths):
+    ts, close = _series(300)
+    for end in range(50, 300, 7):
+        _check(_bars(ts[:end], close[:end]))
+        # The forming bar's close moves between polls without a new bar arriving
+        moved = close[:end].copy()
+        moved[-1] += 0.75
+        _check(_bars(ts[:end], moved))
+    # Re-polls within a bar reuse the state as is; each new batch of bars is a catch-up, not a rebuild
+    assert paths == {"cold": 1, "warm": 35}
+
+def test_growing_series_extends_instead_of_rebuilding(paths):
+    ts, close = _series(300)
+    for end in range(50, 300):
+        _check(_bars(ts[:end], close[:end]))
+    # One rebuild on the first call, then every new bar is caught up from the stored state
+    assert paths == {"cold": 1, "warm": 249}